@@ -1,7 +1,23 @@
-from openai import OpenAI
+from openai import AsyncOpenAI
+import asyncio
 import os
+import weakref
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# One client per running event loop. main_workflow starts a fresh loop for
+# every task, and httpx keep-alive connections pooled under a closed loop
+# raise "RuntimeError: Event loop is closed" when the next task touches them,
+# so a module-level client cannot be shared across tasks. The keys are weak
+# so a finished task's loop and client can be collected instead of
+# accumulating for the life of the process.
+_clients = weakref.WeakKeyDictionary()
+
+def _get_client() -> AsyncOpenAI:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        _clients[loop] = client
+    return client
 
 class LLM_Agent:
     def __init__(self, model: str = "gpt-4o"):
@@ -12,23 +28,34 @@ class LLM_Agent:
             model_choice (str): Either "gpt-4o" or "o3-mini".
         """
         self.model = model
-        
-    def get_response(self, messages) -> str:
+
+    async def get_response(self, messages, temperature: float = None) -> str:
         """
         Sends a prompt to the OpenAI model and returns the response.
+        Async so that independent candidate generations can run concurrently.
+        The response is streamed: tokens are consumed as they are produced,
+        and cancelling the coroutine mid-stream abandons the remaining
+        generation instead of waiting for the full completion.
 
         Args:
-            prompt (str): The input prompt.
+            messages: The conversation to send.
+            temperature: Optional sampling temperature (omitted when None,
+                since some models only accept the default).
 
         Returns:
             str: The model's response.
         """
-        completion = client.chat.completions.create(
-            model=self.model,
-            messages=messages
-        )
+        kwargs = {"model": self.model, "messages": messages, "stream": True}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
 
-        return completion.choices[0].message.content
+        stream = await _get_client().chat.completions.create(**kwargs)
+        chunks = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                chunks.append(chunk.choices[0].delta.content)
+
+        return "".join(chunks)
 
 class Reasoning_Agent(LLM_Agent):
     def __init__(self, model: str = "o3-mini"):
@@ -47,13 +74,13 @@ if __name__ == "__main__":
         {"role": "system", "content": "You are a helpful assistant."},
         {"role": "user", "content": "Can you explain the concept of recursion in programming?"}
     ]
-    #response = agent.get_response(messages)
+    #response = asyncio.run(agent.get_response(messages))
     #print(response)
-    
+
     reasoning_agent = Reasoning_Agent(model="o3-mini")
     messages = [
         {"role": "system", "content": "You are a helpful assistant."},
         {"role": "user", "content": "Can you explain the concept of recursion in programming?"}
     ]
-    solution = reasoning_agent.get_response(messages)
-    print(solution)
\ No newline at end of file
+    solution = asyncio.run(reasoning_agent.get_response(messages))
+    print(solution)
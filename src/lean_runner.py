@@ -1,19 +1,24 @@
-import subprocess
+import itertools
 import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def execute_lean_code(code: str) -> str:
+def execute_lean_code(code: str, temp_file: str = "TempTest.lean") -> str:
     """
-    Writes Lean code to TempProject.lean in temp_project directory, 
+    Writes Lean code to TempProject.lean in temp_project directory,
     executes it, and returns the output or errors.
-    
+
     Args:
         code: The Lean code to execute
-        
+        temp_file: Filename to write within lean_playground. Concurrent
+            verifications must pass distinct names so they don't clobber
+            each other.
+
     Returns:
         str: Execution result or error message
     """
-    temp_file = "TempTest.lean"  # Fixed filename
-    
+
     try:
         # Write the Lean code to the temp file
         temp_path = os.path.join("lean_playground", temp_file)
@@ -51,3 +56,53 @@ def execute_lean_code(code: str) -> str:
     except Exception as e:
         return f"Unexpected error while running Lean: {str(e)}"
 
+
+class LeanWorkerPool:
+    """
+    Bounded pool of warm workers for Lean verification. Each worker thread
+    owns a dedicated temp file inside lean_playground, so concurrent
+    verifications never clobber each other, and all runs share the same lake
+    workspace so the toolchain's build cache stays warm across invocations.
+
+    `lake lean` has no persistent server mode, so a Lean process is still
+    spawned per verification; the pool amortizes what it can (workspace and
+    olean cache reuse) and bounds parallelism to half the cores so Lean's own
+    threads don't oversubscribe the machine.
+    """
+
+    def __init__(self, num_workers: int = None):
+        if num_workers is None:
+            num_workers = max(1, (os.cpu_count() or 2) // 2)
+        self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="lean-worker")
+        self._local = threading.local()
+        self._counter = itertools.count()
+
+    def _worker_temp_file(self) -> str:
+        """Returns this worker thread's dedicated temp filename."""
+        name = getattr(self._local, "temp_file", None)
+        if name is None:
+            name = f"TempWorker{next(self._counter)}.lean"
+            self._local.temp_file = name
+        return name
+
+    def _run(self, code: str) -> str:
+        return execute_lean_code(code, self._worker_temp_file())
+
+    def submit(self, code: str):
+        """Schedules a verification and returns its concurrent Future."""
+        return self._executor.submit(self._run, code)
+
+    def verify(self, code: str) -> str:
+        """Runs a verification on a pool worker and blocks for the result."""
+        return self.submit(code).result()
+
+
+_default_pool = None
+
+def get_worker_pool() -> LeanWorkerPool:
+    """Returns the per-process LeanWorkerPool singleton, creating it lazily."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = LeanWorkerPool()
+    return _default_pool
+